@@ -1,154 +1,427 @@
+import dbm
+import os
+import shelve
+import threading
+import zipfile
 import tkinter as tk
 from tkinter import messagebox
-from datetime import datetime
-from geopy.geocoders import Nominatim
-from tzwhere import tzwhere
-from pytz import timezone, utc
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+import ciso8601
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.figure import Figure
 from matplotlib.patches import Circle
 
-from skyfield.api import Star, load, wgs84
-from skyfield.data import hipparcos
-from skyfield.projections import build_stereographic_projection
-
 # Settings
 chart_size = 8            # Size of the star chart in inches
 max_star_size = 80        # Maximum marker size for the brightest stars
 limiting_magnitude = 6    # Only plot stars brighter than this magnitude
+lod_magnitude = 5.5       # Fainter stars are only drawn when zoomed in
+hover_tolerance = 5       # Hover hit radius in pixels
+
+# Stars are splatted per magnitude bin; marker size is taken at the bin
+# midpoint, in points, sqrt() because scatter sizes are areas
+def marker_size(mag):
+    return np.sqrt(max_star_size * np.exp2(mag * (-np.log2(10) / 2.5)))
+
+MAG_EDGES = [-2, 1, 2, 3, 4, lod_magnitude]
+MAG_BINS = [(lo, hi, marker_size((lo + hi) / 2))
+            for lo, hi in zip(MAG_EDGES[:-1], MAG_EDGES[1:])]
+FAINT_MS = marker_size((lod_magnitude + limiting_magnitude) / 2)
+
+# Offscreen star image, rasterized directly instead of drawing markers
+NAVY = np.array([0, 0, 128], np.float32)
+WHITE = np.array([255, 255, 255], np.float32)
 
-# Load ephemeris and star catalog
-eph = load('de421.bsp')
-with load.open(hipparcos.URL) as f:
-    stars = hipparcos.load_dataframe(f)
+@lru_cache(maxsize=None)
+def gaussian_kernel(ms, dpi):
+    # Pixel offsets and weights for a star of marker size ms points;
+    # a '.' marker is half the marker size across
+    sigma = max(ms * 0.25 * dpi / 72 / 2, 0.5)
+    r = int(np.ceil(2 * sigma))
+    dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+    w = np.exp(-(dx * dx + dy * dy) / (2 * sigma * sigma)).astype(np.float32)
+    keep = w > 0.05
+    return dy[keep], dx[keep], w[keep]
 
-# Pre-instantiate tzwhere for performance
-tz_finder = tzwhere.tzwhere()
+def rasterize(view, groups, shape):
+    # Render (star index, kernel) groups over the view ((x0, x1), (y0, y1))
+    # to an RGB image of shape (height, width): navy sky inside the
+    # horizon, black outside
+    (x0, x1), (y0, y1) = view
+    h, w = shape
+    gx = x0 + (np.arange(w, dtype=np.float32) + 0.5) * ((x1 - x0) / w)
+    gy = y0 + (np.arange(h, dtype=np.float32) + 0.5) * ((y1 - y0) / h)
+    disk = gx[None, :] ** 2 + gy[:, None] ** 2 <= 1
+    acc = np.zeros((h, w), np.float32)
+    for idx, (dy, dx, wk_all) in groups:
+        fx = (XS[idx] - x0) * (w / (x1 - x0))
+        fy = (YS[idx] - y0) * (h / (y1 - y0))
+        inside = (fx >= 0) & (fx < w) & (fy >= 0) & (fy < h)
+        ix = fx[inside].astype(np.intp)
+        iy = fy[inside].astype(np.intp)
+        for oy, ox, wk in zip(dy, dx, wk_all):
+            px, py = ix + ox, iy + oy
+            ok = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+            np.add.at(acc, (py[ok], px[ok]), wk)
+    acc = np.minimum(acc, 1)
+    img = np.where(disk[..., None], NAVY, 0) + acc[..., None] * (WHITE - NAVY)
+    return img.astype(np.uint8)
 
-def generate_star_chart(location_name, when_str, canvas_frame, draw_grid):
+def axes_shape():
+    # Axes size in display pixels, so one image pixel is one screen pixel
+    bbox = AX.get_window_extent()
+    return max(int(round(bbox.height)), 1), max(int(round(bbox.width)), 1)
+
+# Alt-Az grid geometry, precomputed once
+ALTS = np.arange(15, 90, 15)
+RING_R = np.tan(np.radians(90 - ALTS) / 2)
+AZS = np.arange(0, 360, 30)
+SPOKE_X, SPOKE_Y = np.cos(np.radians(AZS)), np.sin(np.radians(AZS))
+SPOKE_SEGMENTS = np.stack([np.zeros((len(AZS), 2)),
+                           np.stack([SPOKE_X, SPOKE_Y], 1)], 1)
+
+# Preprocessed bright-star catalog, written on first run so later starts
+# skip downloading and parsing the raw Hipparcos file
+CATALOG_CACHE = 'hip_bright.npz'
+
+def _load_bright_catalog():
     try:
-        # Geocode the location
-        locator = Nominatim(user_agent='star_chart_app',timeout=10)
-        loc = locator.geocode(location_name)
+        with np.load(CATALOG_CACHE) as d:
+            if float(d['limit']) == limiting_magnitude:
+                return {k: d[k] for k in d.files}
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        pass  # missing or unreadable cache, rebuild it
+
+    from skyfield.api import load
+    from skyfield.data import hipparcos
+    with load.open(hipparcos.URL) as f:
+        stars = hipparcos.load_dataframe(f)
+
+    # Only stars brighter than the limiting magnitude are ever plotted, so
+    # keep just that subset of the full Hipparcos catalog
+    bright = np.flatnonzero((stars['magnitude'] <= limiting_magnitude).to_numpy())
+    ra = np.radians(stars['ra_degrees'].to_numpy()[bright]).astype(np.float32)
+    dec = np.radians(stars['dec_degrees'].to_numpy()[bright]).astype(np.float32)
+    names = (stars['proper'].fillna('').to_numpy()[bright]
+             if 'proper' in stars else np.full(len(bright), ''))
+    catalog = {
+        'limit': np.float64(limiting_magnitude),
+        'hip': stars.index.to_numpy()[bright],
+        'names': names.astype(str),
+        'mag': stars['magnitude'].to_numpy(np.float32)[bright],
+        'dx': np.cos(dec) * np.cos(ra),
+        'dy': np.cos(dec) * np.sin(ra),
+        'dz': np.sin(dec),
+    }
+    # Write to a temporary file first so an interrupted first run
+    # never leaves a truncated cache behind
+    tmp = CATALOG_CACHE + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez(f, **catalog)
+    os.replace(tmp, CATALOG_CACHE)
+    return catalog
+
+# Heavy modules, the star catalog and the timezone index are loaded by
+# _ensure_data(), started on a background thread once the window is up
+_loaded = False
+_load_lock = threading.Lock()
+
+def _ensure_data():
+    global _loaded, wgs84, cKDTree, TS, TF, locator, project_stars
+    global DIR_X, DIR_Y, DIR_Z, MAGS32, XS, YS
+    global BRIGHT_IDX, FAINT_IDX, BIN_IDX, BRIGHT_META
+    with _load_lock:
+        if _loaded:
+            return
+        from geopy.geocoders import Nominatim
+        from scipy.spatial import cKDTree
+        from skyfield.api import load, wgs84
+        from timezonefinder import TimezoneFinder
+
+        # Load star catalog
+        catalog = _load_bright_catalog()
+
+        # Invariant Skyfield objects, built once and reused on every render
+        TS = load.timescale()
+
+        # Direction cosines of the bright stars, stored as separate float32 arrays
+        DIR_X, DIR_Y, DIR_Z = catalog['dx'], catalog['dy'], catalog['dz']
+        MAGS32 = catalog['mag']
+
+        # Projected positions, overwritten in place on every render
+        XS = np.empty(len(MAGS32), np.float32)
+        YS = np.empty(len(MAGS32), np.float32)
+
+        # Per-star metadata for the hover annotation
+        BRIGHT_META = {
+            'hip_id': catalog['hip'],
+            'proper': catalog['names'],
+            'magnitude': MAGS32,
+        }
+
+        # Level of detail: the full-sky view only shows the brighter stars
+        BRIGHT_IDX = np.flatnonzero(MAGS32 <= lod_magnitude)
+        FAINT_IDX = np.flatnonzero(MAGS32 > lod_magnitude)
+        BIN_IDX = [np.flatnonzero((MAGS32 > lo) & (MAGS32 <= hi))
+                   for lo, hi, _ in MAG_BINS]
+
+        # Pre-instantiate the timezone finder once; it keeps its polygon index in memory
+        TF = TimezoneFinder(in_memory=True)
+        locator = Nominatim(user_agent='star_chart_app', timeout=10)
+
+        # Compile the projection kernel off the UI thread
+        project_stars = _build_projection_kernel()
+        project_stars(DIR_X, DIR_Y, DIR_Z, 1.0, 0.0, 0.0, XS, YS)
+
+        _loaded = True
+
+def _preload():
+    try:
+        _ensure_data()
+    except Exception:
+        pass  # retried, and reported, on the first render
+
+def _build_projection_kernel():
+    # Imported here so numba stays off the startup path. The kernel is
+    # serial: a few thousand stars take microseconds, and numba's parallel
+    # thread pool started from the preload thread can keep the process
+    # alive after the window closes
+    from numba import njit
+
+    # Stereographic projection of unit vectors about a center unit vector,
+    # using the same formula as skyfield.projections, fused into one pass
+    @njit(fastmath=True)
+    def project_stars(dir_x, dir_y, dir_z, cx, cy, cz, out_x, out_y):
+        t0 = 1 / np.sqrt(cx * cx + cy * cy)
+        t2 = np.sqrt(1 - cz * cz)
+        t6 = t0 * cz
+        for i in range(dir_x.shape[0]):
+            x, y, z = dir_x[i], dir_y[i], dir_z[i]
+            t14 = x * cx + y * cy
+            t5 = 1 / (t0 * t2 * t14 + z * cz + 1)
+            out_x[i] = t0 * t5 * (x * cy - cx * y)
+            out_y[i] = -t5 * (t6 * t14 - t2 * z)
+
+    return project_stars
+
+def project_bright_stars(center_ra, center_dec):
+    project_stars(DIR_X, DIR_Y, DIR_Z,
+                  np.cos(center_dec) * np.cos(center_ra),
+                  np.cos(center_dec) * np.sin(center_ra),
+                  np.sin(center_dec), XS, YS)
+    return XS, YS
+
+# Timezone lookups are memoized per rounded (lat, lon) cell
+@lru_cache(maxsize=4096)
+def _tz_at(lat_q, lon_q):
+    return TF.timezone_at(lng=lon_q, lat=lat_q)
+
+# Zones are meant to be reused as singletons
+@lru_cache(maxsize=None)
+def _zi(name):
+    return ZoneInfo(name)
+
+def localize(dt, tz):
+    # Match pytz.localize(is_dst=False): standard time for ambiguous fall-back
+    # times (fold=1) and for times in a spring-forward gap (fold=0)
+    local = dt.replace(tzinfo=tz)
+    if local.astimezone(timezone.utc).astimezone(tz).replace(tzinfo=None) != dt:
+        return local  # in a gap
+    return local.replace(fold=1)
+
+# optional cache for geocoding
+CACHE = {
+    "Boston, MA": (42.3601, -71.0589),
+    # ... other locations
+}
+
+# Observer zenith RA/Dec, memoized per quantized site and minute
+@lru_cache(maxsize=64)
+def _observer_state(lat_q, lon_q, utc_iso):
+    t = TS.from_datetime(datetime.fromisoformat(utc_iso))
+    observer = wgs84.latlon(lat_q, lon_q).at(t)
+    ra, dec, _ = observer.radec()
+    return ra.radians, dec.radians
+
+# Persistent geocoding cache, seeded with the known locations above
+GEOCACHE_PATH = os.path.expanduser('~/.starscope_geocache.db')
+
+@lru_cache(maxsize=1024)
+def geocode_cached(name):
+    # The disk cache is best effort: if it cannot be opened (unwritable home,
+    # locked by another instance, corrupt file) fall back to a live lookup
+    try:
+        with shelve.open(GEOCACHE_PATH) as db:
+            if name in db:
+                return db[name]
+    except (OSError, dbm.error):
+        pass
+
+    if name in CACHE:
+        latlon = CACHE[name]
+    else:
+        loc = locator.geocode(name)
         if loc is None:
-            raise ValueError(f"Location '{location_name}' not found.")
-        lat, lon = loc.latitude, loc.longitude
+            raise ValueError(f"Location '{name}' not found.")
+        latlon = (loc.latitude, loc.longitude)
+
+    try:
+        with shelve.open(GEOCACHE_PATH) as db:
+            db[name] = latlon
+    except (OSError, dbm.error):
+        pass
+    return latlon
+
+# Current render state shared with the zoom and hover callbacks
+VIEW = {'xs': None, 'ys': None, 'bright_idx': None, 'faint_above': None,
+        'bins': None, 'tree': None, 'faint_tree': None,
+        'faint_idx': np.empty(0, dtype=np.intp), 'refresh_pending': False}
+
+def generate_star_chart(location_name, when_str, draw_grid):
+    try:
+        _ensure_data()
+
+        # Geocode the location
+        lat, lon = geocode_cached(location_name)
 
         # Parse local date-time
-        dt = datetime.strptime(when_str, '%Y-%m-%d %H:%M')
-        tz_name = tz_finder.tzNameAt(lat, lon)
+        try:
+            dt = ciso8601.parse_datetime(when_str.strip().replace(' ', 'T'))
+        except ValueError:
+            raise ValueError(f"Invalid date & time '{when_str}'; "
+                             "use YYYY-MM-DD HH:MM, e.g. 2024-01-01 05:00.") from None
+        if dt.tzinfo is not None:
+            raise ValueError("Enter a local date-time without a UTC offset.")
+        tz_name = _tz_at(round(lat, 3), round(lon, 3))
         if tz_name is None:
             raise ValueError("Cannot determine timezone for this location.")
-        local_tz = timezone(tz_name)
-        local_dt = local_tz.localize(dt)
-        utc_dt = local_dt.astimezone(utc)
+        local_dt = localize(dt, _zi(tz_name))
+        utc_dt = local_dt.astimezone(timezone.utc)
 
         # Compute sky positions
-        ts = load.timescale()
-        t = ts.from_datetime(utc_dt)
-        earth = eph['earth']
-        observer = wgs84.latlon(lat, lon).at(t)
-
-        # Build stereographic projection centered on zenith
-        ra, dec, _ = observer.radec()
-        center_star = Star(ra=ra, dec=dec)
-        center_obs = earth.at(t).observe(center_star)
-        proj = build_stereographic_projection(center_obs)
-
-        # Project all stars and filter by magnitude
-        star_obs = earth.at(t).observe(Star.from_dataframe(stars))
-        stars['x'], stars['y'] = proj(star_obs)
-        bright = stars['magnitude'] <= limiting_magnitude
-        df = stars[bright].copy().reset_index()  # 'index' holds HIP ID
-        mags = df['magnitude']
-        sizes = max_star_size * 10 ** (mags / -2.5)
-
-        # Create figure
-        fig, ax = plt.subplots(figsize=(chart_size, chart_size))
-        ax.set_facecolor('black')
-        ax.add_patch(Circle((0, 0), 1, color='navy', fill=True))
-
-        # Scatter plot of stars
-        scatter = ax.scatter(df['x'], df['y'], s=sizes,
-                             color='white', marker='.', zorder=2)
-        horizon = Circle((0, 0), 1, transform=ax.transData)
-        for col in ax.collections:
-            col.set_clip_path(horizon)
-
-        # Optional Alt-Az grid
-        if draw_grid:
-            for alt in range(15, 90, 15):
-                r = np.tan(np.radians(90 - alt) / 2)
-                circ = plt.Circle((0, 0), r, edgecolor='gray',
-                                  facecolor='none', linestyle='--', linewidth=0.5)
-                ax.add_patch(circ)
-                ax.text(0, r, f"{alt}°", color='gray', fontsize=7,
-                        ha='center', va='bottom')
-            for az in range(0, 360, 30):
-                ang = np.radians(az)
-                x, y = np.cos(ang), np.sin(ang)
-                ax.plot([0, x], [0, y], color='gray',
-                        linestyle='--', linewidth=0.5)
-                ax.text(1.05 * x, 1.05 * y, f"{az}°", color='gray',
-                        fontsize=7, ha='center', va='center')
-
-        ax.set_xlim(-1, 1)
-        ax.set_ylim(-1, 1)
-        ax.axis('off')
-
-        # Interactive annotation
-        annot = ax.annotate(
-            "", xy=(0, 0), xytext=(10, 10), textcoords="offset points",
-            bbox=dict(boxstyle="round", fc="w", alpha=0.8),
-            arrowprops=dict(arrowstyle="->")
-        )
-        annot.set_visible(False)
-
-        def update_annot(ind):
-            idx = ind["ind"][0]
-            x, y = scatter.get_offsets()[idx]
-            annot.xy = (x, y)
-            row = df.iloc[idx]
-            hip_id = row['index']
-            name = row.get('proper', '') if row.get('proper', '') else f"HIP {hip_id}"
-            annot.set_text(f"{name}\nMag: {row['magnitude']:.2f}")
-
-        def hover(event):
-            if event.inaxes == ax:
-                cont, ind = scatter.contains(event)
-                if cont:
-                    update_annot(ind)
-                    annot.set_visible(True)
-                    fig.canvas.draw_idle()
-                else:
-                    if annot.get_visible():
-                        annot.set_visible(False)
-                        fig.canvas.draw_idle()
-
-        fig.canvas.mpl_connect('motion_notify_event', hover)
-
-        # Embed in Tkinter
-        for w in canvas_frame.winfo_children():
-            w.destroy()
-        canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack()
-        plt.close(fig)
+        ra, dec = _observer_state(round(lat, 4), round(lon, 4),
+                                  utc_dt.isoformat(timespec='minutes'))
+
+        # Project the bright stars stereographically about the zenith
+        VIEW['xs'], VIEW['ys'] = xs, ys = project_bright_stars(ra, dec)
+
+        # Drop stars below the horizon, i.e. outside the unit circle
+        above = xs * xs + ys * ys <= 1.0
+        VIEW['bright_idx'] = bright = BRIGHT_IDX[above[BRIGHT_IDX]]
+        VIEW['faint_above'] = FAINT_IDX[above[FAINT_IDX]]
+        VIEW['bins'] = [idx[above[idx]] for idx in BIN_IDX]
+
+        # Update the persistent chart in place
+        VIEW['tree'] = cKDTree(np.column_stack([xs[bright], ys[bright]]))
+        for artist in GRID_ARTISTS:
+            artist.set_visible(draw_grid)
+        ANNOT.set_visible(False)
+        AX.set_xlim(-1, 1)
+        AX.set_ylim(-1, 1)
+        TOOLBAR.update()
+        CANVAS.draw_idle()
 
     except Exception as e:
         messagebox.showerror("Error", str(e))
 
-# optional cache for geocoding
-CACHE = {
-    "Boston, MA": (42.3601, -71.0589),
-    # ... other locations
-}
+def on_zoom(ax):
+    # x and y limits change separately on every pan/zoom step (and on every
+    # render); refresh the view once, after both, before the pending redraw
+    if not VIEW['refresh_pending']:
+        VIEW['refresh_pending'] = True
+        root.after_idle(refresh_view)
+
+def refresh_view():
+    # Re-rasterize the stars for the current view, adding faint ones when zoomed
+    VIEW['refresh_pending'] = False
+    view = (x0, x1), (y0, y1) = AX.get_xlim(), AX.get_ylim()
+    xs, ys = VIEW['xs'], VIEW['ys']
+    if xs is None:
+        return
+    faint = VIEW['faint_above']
+    if x1 - x0 >= 2 and y1 - y0 >= 2:
+        idx = faint[:0]
+    else:
+        fx, fy = xs[faint], ys[faint]
+        idx = faint[(fx >= x0) & (fx <= x1) & (fy >= y0) & (fy <= y1)]
+    VIEW['faint_idx'] = idx
+    VIEW['faint_tree'] = cKDTree(np.column_stack([xs[idx], ys[idx]])) if len(idx) else None
+
+    groups = [(bin_idx, gaussian_kernel(ms, FIG.dpi))
+              for bin_idx, (_, _, ms) in zip(VIEW['bins'], MAG_BINS)]
+    if len(idx):
+        groups.append((idx, gaussian_kernel(FAINT_MS, FIG.dpi)))
+    IMAGE.set_data(rasterize(view, groups, axes_shape()))
+    IMAGE.set_extent([x0, x1, y0, y1])
+    CANVAS.draw_idle()
+
+def update_annot(i):
+    ANNOT.xy = (VIEW['xs'][i], VIEW['ys'][i])
+    name = BRIGHT_META['proper'][i] or f"HIP {BRIGHT_META['hip_id'][i]}"
+    ANNOT.set_text(f"{name}\nMag: {BRIGHT_META['magnitude'][i]:.2f}")
+
+def on_draw(event):
+    # Background for blitting, captured after every full redraw
+    BLIT['bg'] = CANVAS.copy_from_bbox(FIG.bbox)
+    if ANNOT.get_visible():
+        AX.draw_artist(ANNOT)
+
+def blit_annot():
+    if BLIT['bg'] is None:
+        CANVAS.draw_idle()
+        return
+    CANVAS.restore_region(BLIT['bg'])
+    if ANNOT.get_visible():
+        AX.draw_artist(ANNOT)
+    CANVAS.blit(FIG.bbox)
+
+def nearest_star(x, y):
+    # Closest displayed star within hover_tolerance display pixels, or None.
+    # x and y scales differ after a rectangle zoom, so the trees are searched
+    # with a radius covering the whole pixel ellipse and candidates are then
+    # compared in pixels
+    if VIEW['tree'] is None:
+        return None
+    (x0, x1), (y0, y1) = AX.get_xlim(), AX.get_ylim()
+    sx = AX.bbox.width / abs(x1 - x0)
+    sy = AX.bbox.height / abs(y1 - y0)
+    radius = hover_tolerance / min(sx, sy)
+    best, best_dist = None, hover_tolerance
+    for tree, star_idx in ((VIEW['tree'], VIEW['bright_idx']),
+                           (VIEW['faint_tree'], VIEW['faint_idx'])):
+        if tree is None:
+            continue
+        cand = star_idx[np.asarray(tree.query_ball_point([x, y], radius), dtype=np.intp)]
+        if not len(cand):
+            continue
+        dist = np.hypot((VIEW['xs'][cand] - x) * sx, (VIEW['ys'][cand] - y) * sy)
+        k = np.argmin(dist)
+        if dist[k] <= best_dist:
+            best, best_dist = cand[k], dist[k]
+    return best
+
+def hover(event):
+    if event.inaxes == AX:
+        i = nearest_star(event.xdata, event.ydata)
+        if i is not None:
+            update_annot(i)
+            ANNOT.set_visible(True)
+            blit_annot()
+        else:
+            if ANNOT.get_visible():
+                ANNOT.set_visible(False)
+                blit_annot()
 
 # GUI Setup
 root = tk.Tk()
 root.title("StarScope Viewer")
+threading.Thread(target=_preload, daemon=True).start()
 
 frame_inputs = tk.Frame(root)
 frame_inputs.pack(pady=5)
@@ -169,11 +442,65 @@ grid_checkbox.grid(row=4, column=0, sticky='w', pady=5)
 generate_button = tk.Button(
     frame_inputs, text="Generate Star Chart",
     command=lambda: generate_star_chart(
-        location_entry.get(), time_entry.get(), canvas_frame, grid_var.get() == 1)
+        location_entry.get(), time_entry.get(), grid_var.get() == 1)
 )
 generate_button.grid(row=5, column=0, pady=10)
 
 canvas_frame = tk.Frame(root)
 canvas_frame.pack(padx=10, pady=10)
 
-root.mainloop()
\ No newline at end of file
+# Build the chart once; renders only update its artists
+# (a bare Figure, not pyplot, so no figure manager is created or closed)
+FIG = Figure(figsize=(chart_size, chart_size))
+AX = FIG.add_subplot()
+AX.set_facecolor('black')
+
+# Sky and stars are a single image, redrawn by rasterize()
+IMAGE = AX.imshow(rasterize(((-1, 1), (-1, 1)), [], axes_shape()),
+                  extent=[-1, 1, -1, 1], origin='lower',
+                  interpolation='nearest', aspect='auto')
+
+# Alt-Az grid, hidden until requested
+GRID_ARTISTS = [
+    AX.add_collection(PatchCollection(
+        [Circle((0, 0), r) for r in RING_R], edgecolor='gray',
+        facecolor='none', linestyle='--', linewidth=0.5)),
+    AX.add_collection(LineCollection(
+        SPOKE_SEGMENTS, colors='gray', linestyles='--', linewidths=0.5)),
+]
+for alt, r in zip(ALTS, RING_R):
+    GRID_ARTISTS.append(AX.text(0, r, f"{alt}°", color='gray', fontsize=7,
+                                ha='center', va='bottom'))
+for az, x, y in zip(AZS, SPOKE_X, SPOKE_Y):
+    GRID_ARTISTS.append(AX.text(1.05 * x, 1.05 * y, f"{az}°", color='gray',
+                                fontsize=7, ha='center', va='center'))
+for artist in GRID_ARTISTS:
+    artist.set_visible(False)
+
+AX.set_xlim(-1, 1)
+AX.set_ylim(-1, 1)
+AX.axis('off')
+
+# Interactive annotation
+ANNOT = AX.annotate(
+    "", xy=(0, 0), xytext=(10, 10), textcoords="offset points",
+    bbox=dict(boxstyle="round", fc="w", alpha=0.8),
+    arrowprops=dict(arrowstyle="->")
+)
+ANNOT.set_visible(False)
+ANNOT.set_animated(True)  # drawn by blitting, not by full redraws
+BLIT = {'bg': None}
+
+# Embed in Tkinter
+CANVAS = FigureCanvasTkAgg(FIG, master=canvas_frame)
+CANVAS.mpl_connect('draw_event', on_draw)
+CANVAS.draw()
+TOOLBAR = NavigationToolbar2Tk(CANVAS, canvas_frame)  # zoom reveals fainter stars
+CANVAS.get_tk_widget().pack()
+
+AX.callbacks.connect('xlim_changed', on_zoom)
+AX.callbacks.connect('ylim_changed', on_zoom)
+CANVAS.mpl_connect('resize_event', lambda event: on_zoom(AX))
+CANVAS.mpl_connect('motion_notify_event', hover)
+
+root.mainloop()